@@ -1,3 +1,4 @@
+import asyncio
 import streamlit as st
 from news_paper_summarizer import (
     NewsConfig,
@@ -20,9 +21,10 @@ st.caption("Fast • Clean • Easy-to-read news summaries")
 # Sidebar controls
 st.sidebar.header("🔧 Settings")
 
-category = st.sidebar.selectbox(
-    "Select Category",
-    ["tech", "sports", "politics", "entertainment", "business", "health", "science"]
+categories = st.sidebar.multiselect(
+    "Select Categories",
+    ["tech", "sports", "politics", "entertainment", "business", "health", "science"],
+    default=["tech"]
 )
 
 country = st.sidebar.selectbox(
@@ -35,37 +37,76 @@ enable_voice = st.sidebar.checkbox("🔊 Read Aloud")
 fetch_button = st.sidebar.button("🔄 Fetch News")
 
 # Initialize backend
-config = NewsConfig()
-fetcher = NewsFetcher(config)
+@st.cache_resource
+def get_fetcher():
+    return NewsFetcher(NewsConfig())
+
+
+@st.cache_resource
+def get_voice():
+    return VoiceReader()
+
+
+class NoArticlesError(Exception):
+    """Raised from cached_fetch so empty (failed) fetches are never cached"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_fetch(cats, country):
+    # One concurrent request per category, results kept in category order
+    feeds = asyncio.run(get_fetcher().fetch_many([(cat, country) for cat in cats]))
+    articles = [article for feed in feeds for article in feed]
+    if not articles:
+        raise NoArticlesError
+    return articles
+
+
 summarizer = NewsSummarizer()
-voice = VoiceReader()
+# Only start the TTS engine once Read Aloud is switched on
+voice = get_voice() if enable_voice else None
 
-# Fetch and display news
-if fetch_button:
+# Fetch and summarize news once; (article, summary) pairs are kept in
+# session state so widget reruns skip both the network and the summarizer
+if fetch_button and not categories:
+    st.warning("⚠️ Select at least one category.")
+elif fetch_button:
     with st.spinner("Fetching latest news..."):
-        articles = fetcher.fetch_news(category, country)
+        try:
+            fetched = cached_fetch(tuple(categories), country)
+        except NoArticlesError:
+            fetched = []
+
+        st.session_state["articles"] = [
+            (article, summarizer.summarize_article(article)) for article in fetched
+        ]
+
+# Display news
+if "articles" in st.session_state:
+    articles = st.session_state["articles"]
 
     if not articles:
         st.error("❌ No news articles found.")
     else:
         st.success(f"✅ Found {len(articles)} articles")
 
-        for i, article in enumerate(articles, 1):
+        st_md = st.markdown
+
+        for i, (article, summary) in enumerate(articles, 1):
+            g = article.get
+            title = g("title", "No Title")
+            url = g("url")
+
             with st.container():
-                st.markdown(f"## {i}. {article.get('title','No Title')}")
+                st_md(f"## {i}. {title}")
                 
-                if article.get("url"):
-                    st.markdown(f"[🔗 Read full article]({article['url']})")
-
-                summary = summarizer.summarize_article(article)
+                if url:
+                    st_md(f"[🔗 Read full article]({url})")
 
                 for bullet in summary:
-                    st.markdown(bullet)
+                    st_md(bullet)
 
                 if enable_voice and voice.engine:
                     if st.button(f"🔊 Read Article {i}", key=i):
-                        voice.speak(article.get("title", ""))
-                        for b in summary:
-                            voice.speak(b)
+                        voice.speak_many([g("title", ""), *summary])
 
                 st.divider()
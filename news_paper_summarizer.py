@@ -1,21 +1,50 @@
 import os
+import asyncio
+import importlib.util
 import sys
-import json
 import time
-import requests
+import httpx
 from datetime import datetime
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Iterator, Optional, Tuple
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Optional dependencies with graceful fallbacks
-try:
-    import pyttsx3
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+# pyttsx3 is imported by VoiceReader, which is only built once voice
+# reading is turned on
+TTS_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
+if not TTS_AVAILABLE:
     print("ℹ️  pyttsx3 not installed. Voice reading will be disabled.")
     print("   Install with: pip install pyttsx3")
 
+# httpx only needs h2 installed to speak HTTP/2
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# blingfire pulls in numpy, so it is only imported on the first sentence split
+BLINGFIRE_AVAILABLE = importlib.util.find_spec("blingfire") is not None
+
+@lru_cache(maxsize=None)
+def _load_blingfire():
+    """Import blingfire once, or return None if it cannot be loaded"""
+    try:
+        import blingfire
+        return blingfire
+    except ImportError:
+        return None
+
 try:
     from rich.console import Console
     from rich.panel import Panel
@@ -25,76 +54,202 @@ except ImportError:
     print("ℹ️  rich not installed. Using basic console output.")
     print("   Install with: pip install rich")
 
+# Maps every sentence terminator onto '.' so a plain str.split can find boundaries
+_SENTENCE_END = str.maketrans('!?', '..')
+
+# Read-only lookup tables shared by every NewsConfig
+_CATEGORIES = MappingProxyType({
+    "tech": "technology",
+    "sports": "sports", 
+    "politics": "general",
+    "entertainment": "entertainment",
+    "business": "business",
+    "health": "health",
+    "science": "science"
+})
+_COUNTRIES = MappingProxyType({
+    "us": "United States",
+    "in": "India", 
+    "uk": "United Kingdom",
+    "ca": "Canada",
+    "au": "Australia"
+})
+
 # Configuration
 class NewsConfig:
     def __init__(self):
         self.api_key = os.getenv("NEWSAPI_KEY", "")
         self.base_url = "https://newsapi.org/v2/top-headlines"
-        self.categories = {
-            "tech": "technology",
-            "sports": "sports", 
-            "politics": "general",
-            "entertainment": "entertainment",
-            "business": "business",
-            "health": "health",
-            "science": "science"
-        }
-        self.countries = {
-            "us": "United States",
-            "in": "India", 
-            "uk": "United Kingdom",
-            "ca": "Canada",
-            "au": "Australia"
-        }
+        self.categories = _CATEGORIES
+        self.countries = _COUNTRIES
         self.default_country = "us"
         self.default_category = "tech"
         self.max_articles = 10
         self.timeout = 15
+        self.max_workers = 8
+
+class _ChunkReader:
+    """Minimal file-like view over a byte iterator, for ijson"""
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk
+        if size == 0:
+            return b''
+        return next(self._chunks, b'')
 
 class NewsFetcher:
     def __init__(self, config: NewsConfig):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Daily News Simplifier/1.0'
-        })
+        # One client per fetcher so connections and TLS sessions survive
+        # across fetches; with HTTP/2 the fan-out shares a single connection.
+        # It is a sync client because each asyncio.run() brings a new event
+        # loop, which an AsyncClient's connections cannot outlive.
+        self._client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=config.timeout,
+            headers={'User-Agent': 'Daily News Simplifier/1.0'}
+        )
+        # Last ETag and articles per (category, country) for conditional GETs
+        self._etag_cache: Dict[Tuple[str, str], str] = {}
+        self._body_cache: Dict[Tuple[str, str], List[Dict]] = {}
 
     def fetch_news(self, category: str = None, country: str = None) -> List[Dict]:
         """Fetch news articles from NewsAPI"""
+        return list(self.iter_news(category, country))
+
+    def iter_news(self, category: str = None, country: str = None) -> Iterator[Dict]:
+        """Yield news articles from NewsAPI as they are parsed"""
         if not self.config.api_key:
-            return self._get_demo_news()
+            yield from self._get_demo_news()
+            return
+        
+        params = self._build_params(category, country)
+        key = (params['category'], params['country'])
         
+        try:
+            with self._client.stream(
+                'GET',
+                self.config.base_url, 
+                params=params, 
+                headers=self._conditional_headers(key)
+            ) as response:
+                if response.status_code == 304:
+                    yield from self._body_cache[key]
+                    return
+                
+                response.raise_for_status()
+                if IJSON_AVAILABLE:
+                    # Parse straight off the socket instead of loading the whole payload
+                    articles = []
+                    for article in self._stream_articles(_ChunkReader(response.iter_bytes())):
+                        articles.append(article)
+                        yield article
+                else:
+                    articles = self._parse_articles(_json.loads(response.read()))
+                    yield from articles
+                self._remember(key, response.headers.get('ETag'), articles)
+                
+        except httpx.HTTPError as e:
+            print(f"❌ Network Error: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected Error: {e}")
+
+    async def fetch_many(self, pairs: List[Tuple[str, str]]) -> List[List[Dict]]:
+        """Fetch several (category, country) feeds concurrently"""
+        if not self.config.api_key:
+            # Demo feed is the same for every pair; show it once
+            return [self._get_demo_news() if i == 0 else [] for i in range(len(pairs))]
+        
+        all_params = [self._build_params(category, country) for category, country in pairs]
+        keys = [(params['category'], params['country']) for params in all_params]
+        responses = await asyncio.gather(*[
+            asyncio.to_thread(
+                self._client.get,
+                self.config.base_url,
+                params=params,
+                headers=self._conditional_headers(key)
+            )
+            for params, key in zip(all_params, keys)
+        ], return_exceptions=True)
+        
+        results = []
+        for key, response in zip(keys, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                if response.status_code == 304:
+                    results.append(self._body_cache[key])
+                    continue
+                response.raise_for_status()
+                articles = self._parse_articles(_json.loads(response.content))
+                self._remember(key, response.headers.get('ETag'), articles)
+                results.append(articles)
+            except httpx.HTTPError as e:
+                print(f"❌ Network Error: {e}")
+                results.append([])
+            except Exception as e:
+                print(f"❌ Unexpected Error: {e}")
+                results.append([])
+        return results
+
+    def _build_params(self, category: str = None, country: str = None) -> Dict:
+        """Build NewsAPI query parameters"""
         category = category or self.config.default_category
         country = country or self.config.default_country
         
-        params = {
+        return {
             'category': self.config.categories.get(category, category),
             'country': country,
             'pageSize': self.config.max_articles,
             'apiKey': self.config.api_key
         }
+
+    def _conditional_headers(self, key: Tuple[str, str]) -> Dict:
+        """Send If-None-Match only when we still hold the matching articles"""
+        etag = self._etag_cache.get(key)
+        if etag and key in self._body_cache:
+            return {'If-None-Match': etag}
+        return {}
+
+    def _remember(self, key: Tuple[str, str], etag: Optional[str], articles: List[Dict]):
+        """Cache a successful response for later 304 Not Modified replies"""
+        if etag and articles:
+            self._etag_cache[key] = etag
+            self._body_cache[key] = articles
+
+    @staticmethod
+    def _stream_articles(stream) -> Iterator[Dict]:
+        """Yield articles from a NewsAPI JSON stream, reporting API errors"""
+        status = message = None
+        builder = None
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if prefix == 'status':
+                status = value
+            elif prefix == 'message':
+                message = value
+            elif prefix == 'articles.item' and event == 'start_map':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'articles.item' and event == 'end_map':
+                builder.event(event, value)
+                yield builder.value
+                builder = None
+            elif builder is not None:
+                builder.event(event, value)
         
-        try:
-            response = self.session.get(
-                self.config.base_url, 
-                params=params, 
-                timeout=self.config.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get('status') == 'ok':
-                return data.get('articles', [])
-            else:
-                print(f"❌ API Error: {data.get('message', 'Unknown error')}")
-                return []
-                
-        except requests.RequestException as e:
-            print(f"❌ Network Error: {e}")
-            return []
-        except Exception as e:
-            print(f"❌ Unexpected Error: {e}")
-            return []
+        if status != 'ok':
+            print(f"❌ API Error: {message or 'Unknown error'}")
+
+    @staticmethod
+    def _parse_articles(data: Dict) -> List[Dict]:
+        """Extract articles from a NewsAPI JSON payload"""
+        if data.get('status') == 'ok':
+            return data.get('articles', [])
+        
+        print(f"❌ API Error: {data.get('message', 'Unknown error')}")
+        return []
 
     def _get_demo_news(self) -> List[Dict]:
         """Return demo news when API key is not available"""
@@ -119,60 +274,63 @@ class NewsFetcher:
             }
         ]
 
+def _as_bullet(sentence: str) -> str:
+    """Format a sentence as a bullet, adding '.' only if it has no end punctuation"""
+    if sentence.endswith(('.', '!', '?')):
+        return f"• {sentence}"
+    return f"• {sentence}."
+
+@lru_cache(maxsize=512)
+def _summarize(title: str, description: str) -> Tuple[str, ...]:
+    """Cached summarization keyed on (title, description)"""
+    content: str = description or title
+    
+    if not content:
+        return ("No content available for this article.",)
+    
+    # Clean and prepare text
+    text: str = content.strip()
+    if len(text) < 50:
+        return (f"📰 {text}",)
+    
+    # Simple but effective summarization
+    sentences: List[str] = NewsSummarizer._split_into_sentences(text)
+    
+    if len(sentences) <= 3:
+        return tuple(_as_bullet(s) for s in sentences) or ("• Content could not be summarized.",)
+    
+    # Take most important sentences (first, middle, last); with more than
+    # three sentences these indices are always distinct
+    n: int = len(sentences)
+    bullets: List[str] = [_as_bullet(sentences[i]) for i in (0, n // 2, n - 1)]
+    
+    return tuple(bullets)
+
 class NewsSummarizer:
     @staticmethod
     def summarize_article(article: Dict) -> List[str]:
         """Create 3 bullet point summary from article content"""
-        title = article.get('title', '')
-        description = article.get('description', '')
-        content = description or title
-        
-        if not content:
-            return ["No content available for this article."]
-        
-        # Clean and prepare text
-        text = content.strip()
-        if len(text) < 50:
-            return [f"📰 {text}"]
-        
-        # Simple but effective summarization
-        sentences = NewsSummarizer._split_into_sentences(text)
-        
-        if len(sentences) <= 3:
-            return [f"• {s.strip()}" for s in sentences if s.strip()]
-        
-        # Take most important sentences (first, middle, last)
-        important_sentences = []
-        if sentences:
-            important_sentences.append(sentences[0])  # First sentence
-        if len(sentences) > 2:
-            important_sentences.append(sentences[len(sentences)//2])  # Middle
-        if len(sentences) > 1:
-            important_sentences.append(sentences[-1])  # Last sentence
-        
-        # Format as bullet points
-        bullets = []
-        for sentence in important_sentences[:3]:
-            clean_sentence = sentence.strip()
-            if clean_sentence and not clean_sentence.endswith('.'):
-                clean_sentence += '.'
-            bullets.append(f"• {clean_sentence}")
-        
-        return bullets if bullets else ["• Content could not be summarized."]
+        return list(_summarize(article.get('title') or '', article.get('description') or ''))
 
     @staticmethod
     def _split_into_sentences(text: str) -> List[str]:
         """Split text into sentences"""
-        import re
-        # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        blingfire = _load_blingfire() if BLINGFIRE_AVAILABLE else None
+        if blingfire:
+            # Compiled FST sentence breaker; note it still splits after
+            # abbreviations such as "Dr."
+            return [s for s in (p.strip() for p in blingfire.text_to_sentences(text).split('\n')) if s]
+        return [s for s in (p.strip() for p in text.translate(_SENTENCE_END).split('.')) if s]
 
 class VoiceReader:
+    # Bullet and emoji markers that should not be read aloud
+    _TTS_STRIP = str.maketrans('', '', '•📰')
+
     def __init__(self):
         self.engine = None
         if TTS_AVAILABLE:
             try:
+                import pyttsx3
                 self.engine = pyttsx3.init()
                 self._configure_voice()
             except Exception as e:
@@ -206,13 +364,27 @@ class VoiceReader:
         
         try:
             # Clean text for better speech
-            clean_text = text.replace('•', '').replace('📰', '').strip()
+            clean_text = text.translate(self._TTS_STRIP).strip()
             if clean_text:
                 self.engine.say(clean_text)
                 self.engine.runAndWait()
         except Exception as e:
             print(f"⚠️  TTS Error: {e}")
 
+    def speak_many(self, texts: List[str]):
+        """Queue several texts and speak them in one run of the TTS loop"""
+        if not self.engine:
+            return
+        
+        try:
+            for text in texts:
+                clean_text = text.translate(self._TTS_STRIP).strip()
+                if clean_text:
+                    self.engine.say(clean_text)
+            self.engine.runAndWait()
+        except Exception as e:
+            print(f"⚠️  TTS Error: {e}")
+
 class NewsDisplay:
     def __init__(self):
         self.console = Console() if RICH_AVAILABLE else None
@@ -267,7 +439,7 @@ class DailyNewsApp:
         self.config = NewsConfig()
         self.fetcher = NewsFetcher(self.config)
         self.summarizer = NewsSummarizer()
-        self.voice_reader = VoiceReader()
+        self.voice_reader: Optional[VoiceReader] = None
         self.display = NewsDisplay()
 
     def run(self, category: str = None, country: str = None, voice: bool = False):
@@ -275,6 +447,10 @@ class DailyNewsApp:
         category = category or self.config.default_category
         country = country or self.config.default_country
         
+        # Only start the TTS engine when voice reading was asked for
+        if voice and self.voice_reader is None:
+            self.voice_reader = VoiceReader()
+        
         # Display header
         self.display.display_header(category, country)
         
@@ -288,18 +464,19 @@ class DailyNewsApp:
         
         print(f"✅ Found {len(articles)} articles\n")
         
+        # Summarize articles in parallel, then display in order
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            summaries = list(executor.map(self.summarizer.summarize_article, articles))
+        
         # Display articles
-        for i, article in enumerate(articles, 1):
-            summary = self.summarizer.summarize_article(article)
+        for i, (article, summary) in enumerate(zip(articles, summaries), 1):
             self.display.display_article(i, article, summary)
             
             # Voice reading
             if voice and self.voice_reader.engine:
                 try:
                     title = article.get('title', '')
-                    self.voice_reader.speak(f"Article {i}: {title}")
-                    for bullet in summary:
-                        self.voice_reader.speak(bullet)
+                    self.voice_reader.speak_many([f"Article {i}: {title}", *summary])
                     time.sleep(0.5)  # Brief pause between articles
                 except KeyboardInterrupt:
                     print("\n⏹️  Voice reading stopped by user.")